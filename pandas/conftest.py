@@ -855,6 +855,24 @@ def index_or_series_obj(request):
     return _index_or_series_objs[request.param].copy(deep=True)
 
 
+_index_or_series_objs_allow_na = {
+    key: obj
+    for key, obj in _index_or_series_objs.items()
+    if obj._can_hold_na
+    and not isinstance(obj, MultiIndex)
+    and not (isinstance(obj, Index) and obj.inferred_type == "boolean")
+}
+
+
+@pytest.fixture(params=_index_or_series_objs_allow_na.keys())
+def index_or_series_obj_allow_na(request):
+    """
+    Fixture for index_or_series_obj cases which can hold missing values,
+    i.e. excluding boolean, non-nullable integer and MultiIndex objects
+    """
+    return _index_or_series_objs_allow_na[request.param].copy(deep=True)
+
+
 _typ_objects_series = {
     f"{dtype.__name__}-series": Series(dtype) for dtype in tm.PYTHON_DATA_TYPES
 }
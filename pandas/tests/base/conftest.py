@@ -0,0 +1,14 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def repeated_index_or_series_obj(index_or_series_obj):
+    """
+    Tuple of (obj, repeated) where obj is index_or_series_obj and repeated
+    is obj with its i-th element repeated i + 1 times, so that every
+    element is duplicated apart from the first one.
+    """
+    obj = index_or_series_obj
+    counts = np.arange(1, len(obj) + 1, dtype=np.intp)
+    return obj, np.repeat(obj, counts)
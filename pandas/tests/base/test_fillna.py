@@ -8,7 +8,6 @@ import pytest
 
 from pandas import MultiIndex
 import pandas._testing as tm
-from pandas.tests.base.common import allow_na_ops
 
 
 def test_fillna(index_or_series_obj):
@@ -32,23 +31,22 @@ def test_fillna(index_or_series_obj):
 
 
 @pytest.mark.parametrize("null_obj", [np.nan, None])
-def test_fillna_null(null_obj, index_or_series_obj):
+def test_fillna_null(null_obj, index_or_series_obj_allow_na):
     # GH 11343
-    obj = index_or_series_obj
+    obj = index_or_series_obj_allow_na
     klass = type(obj)
 
-    if not allow_na_ops(obj):
-        pytest.skip(f"{klass} doesn't allow for NA operations")
-    elif len(obj) < 1:
+    if len(obj) < 1:
         pytest.skip("Test doesn't make sense on empty data")
-    elif isinstance(obj, MultiIndex):
-        pytest.skip(f"MultiIndex can't hold '{null_obj}'")
 
     values = obj._values
     fill_value = values[0]
-    expected = values.copy()
+    # gather rather than copy-then-overwrite: the first two positions
+    # both hold the fill value
+    indexer = np.arange(len(values))
+    indexer[0:2] = 0
+    expected = values.take(indexer)
     values[0:2] = null_obj
-    expected[0:2] = fill_value
 
     expected = klass(expected)
     obj = klass(values)
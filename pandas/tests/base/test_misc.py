@@ -5,18 +5,13 @@ import pytest
 
 from pandas._config import using_string_dtype
 
+from pandas._libs import lib
 from pandas.compat import PYPY
 
-from pandas.core.dtypes.common import (
-    is_dtype_equal,
-    is_object_dtype,
-)
+from pandas.core.dtypes.common import is_dtype_equal
 
 import pandas as pd
-from pandas import (
-    Index,
-    Series,
-)
+from pandas import Series
 
 
 def test_isnull_notnull_docstrings():
@@ -32,18 +27,26 @@ def test_isnull_notnull_docstrings():
     assert doc.startswith("\nSeries.isnull is an alias for Series.isna.\n")
 
 
-@pytest.mark.parametrize(
-    "op_name, op",
-    [
-        ("add", "+"),
-        ("sub", "-"),
-        ("mul", "*"),
-        ("mod", "%"),
-        ("pow", "**"),
-        ("truediv", "/"),
-        ("floordiv", "//"),
-    ],
-)
+_binary_ops = [
+    ("add", "+"),
+    ("sub", "-"),
+    ("mul", "*"),
+    ("mod", "%"),
+    ("pow", "**"),
+    ("truediv", "/"),
+    ("floordiv", "//"),
+]
+
+# look up each docstring once rather than once per parametrized case
+_binary_ops_docs = {
+    (klass, name): getattr(klass, name).__doc__
+    for klass in [pd.DataFrame, Series]
+    for op_name, _ in _binary_ops
+    for name in [op_name, "r" + op_name]
+}
+
+
+@pytest.mark.parametrize("op_name, op", _binary_ops)
 def test_binary_ops_docstring(frame_or_series, op_name, op):
     # not using the all_arithmetic_functions fixture with _get_opstr
     # as _get_opstr is used internally in the dynamic implementation of the docstring
@@ -52,11 +55,11 @@ def test_binary_ops_docstring(frame_or_series, op_name, op):
     operand1 = klass.__name__.lower()
     operand2 = "other"
     expected_str = " ".join([operand1, op, operand2])
-    assert expected_str in getattr(klass, op_name).__doc__
+    assert expected_str in _binary_ops_docs[klass, op_name]
 
     # reverse version of the binary ops
     expected_str = " ".join([operand2, op, operand1])
-    assert expected_str in getattr(klass, "r" + op_name).__doc__
+    assert expected_str in _binary_ops_docs[klass, "r" + op_name]
 
 
 def test_ndarray_compat_properties(index_or_series_obj):
@@ -77,8 +80,9 @@ def test_ndarray_compat_properties(index_or_series_obj):
     assert obj.ndim == 1
     assert obj.size == len(obj)
 
-    assert Index([1]).item() == 1
-    assert Series([1]).item() == 1
+
+def test_item(index_or_series):
+    assert index_or_series([1]).item() == 1
 
 
 @pytest.mark.skipif(
@@ -98,13 +102,10 @@ def test_memory_usage(index_or_series_memory_obj):
     res = obj.memory_usage()
     res_deep = obj.memory_usage(deep=True)
 
-    is_object = is_object_dtype(obj) or (is_ser and is_object_dtype(obj.index))
-    is_categorical = isinstance(obj.dtype, pd.CategoricalDtype) or (
-        is_ser and isinstance(obj.index.dtype, pd.CategoricalDtype)
-    )
-    is_object_string = is_dtype_equal(obj, "string[python]") or (
-        is_ser and is_dtype_equal(obj.index.dtype, "string[python]")
-    )
+    dtypes = [obj.dtype, obj.index.dtype] if is_ser else [obj.dtype]
+    is_object = any(lib.is_np_dtype(dtype, "O") for dtype in dtypes)
+    is_categorical = any(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes)
+    is_object_string = any(is_dtype_equal(dtype, "string[python]") for dtype in dtypes)
 
     if len(obj) == 0:
         expected = 0
@@ -154,13 +155,14 @@ def test_searchsorted(request, index_or_series_obj):
                 reason="np.searchsorted doesn't work on pd.MultiIndex: GH 14833"
             )
         )
-    elif obj.dtype.kind == "c" and isinstance(obj, Index):
-        # TODO: Should Series cases also raise? Looks like they use numpy
-        #  comparison semantics https://github.com/numpy/numpy/issues/15981
-        mark = pytest.mark.xfail(reason="complex objects are not comparable")
-        request.applymarker(mark)
 
-    max_obj = max(obj, default=0)
+    if len(obj) == 0:
+        max_obj = 0
+    elif isinstance(obj.dtype, pd.CategoricalDtype) and not obj.dtype.ordered:
+        # unordered categoricals don't support the max reduction
+        max_obj = max(obj)
+    else:
+        max_obj = obj.max()
     index = np.searchsorted(obj, max_obj)
     assert 0 <= index <= len(obj)
 
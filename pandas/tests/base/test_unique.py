@@ -3,24 +3,24 @@ import pytest
 
 import pandas as pd
 import pandas._testing as tm
-from pandas.tests.base.common import allow_na_ops
 
 
 @pytest.mark.filterwarnings(r"ignore:PeriodDtype\[B\] is deprecated:FutureWarning")
-def test_unique(index_or_series_obj):
-    obj = index_or_series_obj
-    obj = np.repeat(obj, range(1, len(obj) + 1))
+def test_unique(repeated_index_or_series_obj):
+    orig, obj = repeated_index_or_series_obj
+    dtype = obj.dtype
     result = obj.unique()
 
-    # dict.fromkeys preserves the order
-    unique_values = list(dict.fromkeys(obj.values))
+    # dict.fromkeys preserves the order; np.repeat keeps the order of first
+    # occurrences, so the non-repeated values give the same uniques
+    unique_values = list(dict.fromkeys(orig.values))
     if isinstance(obj, pd.MultiIndex):
         expected = pd.MultiIndex.from_tuples(unique_values)
         expected.names = obj.names
         tm.assert_index_equal(result, expected, exact=True)
     elif isinstance(obj, pd.Index):
-        expected = pd.Index(unique_values, dtype=obj.dtype)
-        if isinstance(obj.dtype, pd.DatetimeTZDtype):
+        expected = pd.Index(unique_values, dtype=dtype)
+        if isinstance(dtype, pd.DatetimeTZDtype):
             expected = expected.normalize()
         tm.assert_index_equal(result, expected, exact=True)
     else:
@@ -30,62 +30,56 @@ def test_unique(index_or_series_obj):
 
 @pytest.mark.filterwarnings(r"ignore:PeriodDtype\[B\] is deprecated:FutureWarning")
 @pytest.mark.parametrize("null_obj", [np.nan, None])
-def test_unique_null(null_obj, index_or_series_obj):
-    obj = index_or_series_obj
+def test_unique_null(null_obj, index_or_series_obj_allow_na):
+    obj = index_or_series_obj_allow_na
 
-    if not allow_na_ops(obj):
-        pytest.skip("type doesn't allow for NA operations")
-    elif len(obj) < 1:
+    if len(obj) < 1:
         pytest.skip("Test doesn't make sense on empty data")
-    elif isinstance(obj, pd.MultiIndex):
-        pytest.skip(f"MultiIndex can't hold '{null_obj}'")
 
+    dtype = obj.dtype
     values = obj._values
     values[0:2] = null_obj
 
     klass = type(obj)
-    repeated_values = np.repeat(values, range(1, len(values) + 1))
-    obj = klass(repeated_values, dtype=obj.dtype)
+    counts = np.arange(1, len(values) + 1, dtype=np.intp)
+    repeated_values = np.repeat(values, counts)
+    obj = klass(repeated_values, dtype=dtype)
     result = obj.unique()
 
-    unique_values_raw = dict.fromkeys(obj.values)
+    # the non-repeated values have the same first occurrences
+    raw_values = klass(values, dtype=dtype).values
     # because np.nan == np.nan is False, but None == None is True
     # np.nan would be duplicated, whereas None wouldn't
-    unique_values_not_null = [val for val in unique_values_raw if not pd.isnull(val)]
+    unique_values_not_null = list(dict.fromkeys(raw_values[~pd.isna(raw_values)]))
     unique_values = [null_obj] + unique_values_not_null
 
     if isinstance(obj, pd.Index):
-        expected = pd.Index(unique_values, dtype=obj.dtype)
-        if isinstance(obj.dtype, pd.DatetimeTZDtype):
+        expected = pd.Index(unique_values, dtype=dtype)
+        if isinstance(dtype, pd.DatetimeTZDtype):
             result = result.normalize()
             expected = expected.normalize()
         tm.assert_index_equal(result, expected, exact=True)
     else:
-        expected = np.array(unique_values, dtype=obj.dtype)
+        expected = np.array(unique_values, dtype=dtype)
         tm.assert_numpy_array_equal(result, expected)
 
 
-def test_nunique(index_or_series_obj):
-    obj = index_or_series_obj
-    obj = np.repeat(obj, range(1, len(obj) + 1))
+def test_nunique(repeated_index_or_series_obj):
+    _, obj = repeated_index_or_series_obj
     expected = len(obj.unique())
     assert obj.nunique(dropna=False) == expected
 
 
 @pytest.mark.parametrize("null_obj", [np.nan, None])
-def test_nunique_null(null_obj, index_or_series_obj):
-    obj = index_or_series_obj
-
-    if not allow_na_ops(obj):
-        pytest.skip("type doesn't allow for NA operations")
-    elif isinstance(obj, pd.MultiIndex):
-        pytest.skip(f"MultiIndex can't hold '{null_obj}'")
+def test_nunique_null(null_obj, index_or_series_obj_allow_na):
+    obj = index_or_series_obj_allow_na
 
     values = obj._values
     values[0:2] = null_obj
 
     klass = type(obj)
-    repeated_values = np.repeat(values, range(1, len(values) + 1))
+    counts = np.arange(1, len(values) + 1, dtype=np.intp)
+    repeated_values = np.repeat(values, counts)
     obj = klass(repeated_values, dtype=obj.dtype)
 
     if isinstance(obj, pd.CategoricalIndex):
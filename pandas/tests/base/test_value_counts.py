@@ -17,23 +17,31 @@ from pandas import (
     array,
 )
 import pandas._testing as tm
-from pandas.tests.base.common import allow_na_ops
+
+
+def _repeated_counter(obj) -> collections.Counter:
+    # equivalent to collections.Counter(np.repeat(obj, range(1, len(obj) + 1)))
+    # without iterating over the O(N**2) repeated values
+    counter: collections.Counter = collections.Counter()
+    for n, val in enumerate(obj, start=1):
+        counter[val] += n
+    return counter
 
 
 @pytest.mark.filterwarnings(r"ignore:PeriodDtype\[B\] is deprecated:FutureWarning")
-def test_value_counts(index_or_series_obj):
-    obj = index_or_series_obj
-    obj = np.repeat(obj, range(1, len(obj) + 1))
+def test_value_counts(repeated_index_or_series_obj):
+    orig, obj = repeated_index_or_series_obj
+    dtype = obj.dtype
     result = obj.value_counts()
 
-    counter = collections.Counter(obj)
+    counter = _repeated_counter(orig)
     expected = Series(dict(counter.most_common()), dtype=np.int64, name="count")
 
-    if obj.dtype != np.float16:
-        expected.index = expected.index.astype(obj.dtype)
+    if dtype != np.float16:
+        expected.index = expected.index.astype(dtype)
     else:
         with pytest.raises(NotImplementedError, match="float16 indexes are not "):
-            expected.index.astype(obj.dtype)
+            expected.index.astype(dtype)
         return
     if isinstance(expected.index, MultiIndex):
         expected.index.names = obj.names
@@ -41,7 +49,7 @@ def test_value_counts(index_or_series_obj):
         expected.index.name = obj.name
 
     if not isinstance(result.dtype, np.dtype):
-        if getattr(obj.dtype, "storage", "") == "pyarrow":
+        if getattr(dtype, "storage", "") == "pyarrow":
             expected = expected.astype("int64[pyarrow]")
         else:
             # i.e IntegerDtype
@@ -52,53 +60,53 @@ def test_value_counts(index_or_series_obj):
 
 @pytest.mark.parametrize("null_obj", [np.nan, None])
 @pytest.mark.filterwarnings(r"ignore:PeriodDtype\[B\] is deprecated:FutureWarning")
-def test_value_counts_null(null_obj, index_or_series_obj):
-    orig = index_or_series_obj
-    obj = orig.copy()
+def test_value_counts_null(null_obj, index_or_series_obj_allow_na):
+    obj = index_or_series_obj_allow_na
 
-    if not allow_na_ops(obj):
-        pytest.skip("type doesn't allow for NA operations")
-    elif len(obj) < 1:
+    if len(obj) < 1:
         pytest.skip("Test doesn't make sense on empty data")
-    elif isinstance(orig, MultiIndex):
-        pytest.skip(f"MultiIndex can't hold '{null_obj}'")
 
+    dtype = obj.dtype
     values = obj._values
     values[0:2] = null_obj
 
     klass = type(obj)
-    repeated_values = np.repeat(values, range(1, len(values) + 1))
-    obj = klass(repeated_values, dtype=obj.dtype)
+    counts = np.arange(1, len(values) + 1, dtype=np.intp)
+    repeated_values = np.repeat(values, counts)
+    obj = klass(repeated_values, dtype=dtype)
 
+    counter = _repeated_counter(klass(values, dtype=dtype))
     # because np.nan == np.nan is False, but None == None is True
     # np.nan would be duplicated, whereas None wouldn't
-    counter = collections.Counter(obj.dropna())
+    for key in [key for key in counter if pd.isna(key)]:
+        del counter[key]
     expected = Series(dict(counter.most_common()), dtype=np.int64, name="count")
 
-    if obj.dtype != np.float16:
-        expected.index = expected.index.astype(obj.dtype)
+    if dtype != np.float16:
+        expected.index = expected.index.astype(dtype)
     else:
         with pytest.raises(NotImplementedError, match="float16 indexes are not "):
-            expected.index.astype(obj.dtype)
+            expected.index.astype(dtype)
         return
     expected.index.name = obj.name
 
     result = obj.value_counts()
 
     if not isinstance(result.dtype, np.dtype):
-        if getattr(obj.dtype, "storage", "") == "pyarrow":
+        if getattr(dtype, "storage", "") == "pyarrow":
             expected = expected.astype("int64[pyarrow]")
         else:
             # i.e IntegerDtype
             expected = expected.astype("Int64")
     tm.assert_series_equal(result, expected)
 
-    expected[null_obj] = 3
+    null_index = Index([null_obj], dtype=expected.index.dtype, name=expected.index.name)
+    expected = pd.concat(
+        [expected, Series([3], index=null_index, dtype=expected.dtype, name="count")]
+    )
 
     result = obj.value_counts(dropna=False)
-    expected = expected.sort_index()
-    result = result.sort_index()
-    tm.assert_series_equal(result, expected)
+    tm.assert_series_equal(result, expected, check_like=True)
 
 
 def test_value_counts_inferred(index_or_series, using_infer_string):
@@ -213,25 +221,18 @@ def test_value_counts_datetime64(index_or_series, unit):
 
     # GH 3002, datetime64[ns]
     # don't test names though
-    df = pd.DataFrame(
-        {
-            "person_id": ["xxyyzz", "xxyyzz", "xxyyzz", "xxyyww", "foofoo", "foofoo"],
-            "dt": pd.to_datetime(
-                [
-                    "2010-01-01",
-                    "2010-01-01",
-                    "2010-01-01",
-                    "2009-01-01",
-                    "2008-09-09",
-                    "2008-09-09",
-                ]
-            ).as_unit(unit),
-            "food": ["PIE", "GUM", "EGG", "EGG", "PIE", "GUM"],
-        }
-    )
+    dt = pd.to_datetime(
+        [
+            "2010-01-01",
+            "2010-01-01",
+            "2010-01-01",
+            "2009-01-01",
+            "2008-09-09",
+            "2008-09-09",
+        ]
+    ).as_unit(unit)
 
-    s = klass(df["dt"].copy())
-    s.name = None
+    s = klass(dt)
     idx = pd.to_datetime(
         ["2010-01-01 00:00:00", "2008-09-09 00:00:00", "2009-01-01 00:00:00"]
     ).as_unit(unit)
@@ -253,12 +254,8 @@ def test_value_counts_datetime64(index_or_series, unit):
     assert s.nunique() == 3
 
     # with NaT
-    s = df["dt"].copy()
-    s = klass(list(s.values) + [pd.NaT] * 4)
-    if klass is Series:
-        s = s.dt.as_unit(unit)
-    else:
-        s = s.as_unit(unit)
+    nat = np.full(4, np.datetime64("NaT"), dtype=dt.dtype)
+    s = klass(np.concatenate([dt.values, nat]))
 
     result = s.value_counts()
     assert result.index.dtype == f"datetime64[{unit}]"
@@ -8,6 +8,10 @@ from pandas import (
 )
 import pandas._testing as tm
 
+# float_index's values, as float64 and boxed into an object array
+_ARANGE5_25 = np.arange(5) * 2.5
+_ARANGE5_25_OBJ = np.asarray(_ARANGE5_25, dtype=object)
+
 
 class TestFloatNumericIndex:
     @pytest.fixture(params=[np.float64, np.float32])
@@ -100,16 +104,16 @@ class TestFloatNumericIndex:
 
     def test_constructor_coerce(self, mixed_index, float_index):
         self.check_coerce(mixed_index, Index([1.5, 2, 3, 4, 5]))
-        self.check_coerce(float_index, Index(np.arange(5) * 2.5))
+        self.check_coerce(float_index, Index(_ARANGE5_25))
 
-        result = Index(np.array(np.arange(5) * 2.5, dtype=object))
+        result = Index(_ARANGE5_25_OBJ)
         assert result.dtype == object  # as of 2.0 to match Series
         self.check_coerce(float_index, result.astype("float64"))
 
     def test_constructor_explicit(self, mixed_index, float_index):
         # these don't auto convert
         self.check_coerce(
-            float_index, Index((np.arange(5) * 2.5), dtype=object), is_float_index=False
+            float_index, Index(_ARANGE5_25, dtype=object), is_float_index=False
         )
         self.check_coerce(
             mixed_index, Index([1.5, 2, 3, 4, 5], dtype=object), is_float_index=False
@@ -165,28 +169,29 @@ class TestFloatNumericIndex:
         ser.index = ser.index.astype(dtype)
 
         expected = vals[1]
+        etype = type(expected)
 
         result = ser[4.0]
-        assert isinstance(result, type(expected)) and result == expected
+        assert isinstance(result, etype) and result == expected
         result = ser[4]
-        assert isinstance(result, type(expected)) and result == expected
+        assert isinstance(result, etype) and result == expected
 
         result = ser.loc[4.0]
-        assert isinstance(result, type(expected)) and result == expected
+        assert isinstance(result, etype) and result == expected
         result = ser.loc[4]
-        assert isinstance(result, type(expected)) and result == expected
+        assert isinstance(result, etype) and result == expected
 
         result = ser.at[4.0]
-        assert isinstance(result, type(expected)) and result == expected
+        assert isinstance(result, etype) and result == expected
         # GH#31329 .at[4] should cast to 4.0, matching .loc behavior
         result = ser.at[4]
-        assert isinstance(result, type(expected)) and result == expected
+        assert isinstance(result, etype) and result == expected
 
         result = ser.iloc[1]
-        assert isinstance(result, type(expected)) and result == expected
+        assert isinstance(result, etype) and result == expected
 
         result = ser.iat[1]
-        assert isinstance(result, type(expected)) and result == expected
+        assert isinstance(result, etype) and result == expected
 
     def test_doesnt_contain_all_the_things(self):
         idx = Index([np.nan])
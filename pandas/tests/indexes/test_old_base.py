@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from datetime import datetime
 import weakref
 
 import numpy as np
@@ -34,6 +33,23 @@ import pandas._testing as tm
 import pandas.core.algorithms as algos
 from pandas.core.arrays import BaseMaskedArray
 
+_TS_NOV_2011 = Timestamp("2011-11-01")
+_TS_DEC_2011 = Timestamp("2011-12-01")
+
+# keys for test_index_groupby, independent of the index being grouped
+_GROUPBY_FLOAT_KEYS = np.array([1, 2, np.nan, 2, 1])
+_GROUPBY_DT_KEYS = DatetimeIndex(
+    [_TS_NOV_2011, _TS_DEC_2011, pd.NaT, _TS_DEC_2011, _TS_NOV_2011],
+    tz="UTC",
+).values
+_GROUPBY_DT_EXPECTED_KEYS = [_TS_NOV_2011, _TS_DEC_2011]
+
+# inputs and results for test_arithmetic_explicit_conversions
+_ARITH_ARR = np.arange(5, dtype="int64") * 3.2
+_ARITH_ZEROS = np.zeros(5, dtype="float64")
+_ARITH_EXPECTED = Index(_ARITH_ARR, dtype=np.float64)
+_ARITH_EXPECTED_NEG = Index(-_ARITH_ARR, dtype=np.float64)
+
 
 class TestBase:
     @pytest.fixture(
@@ -801,25 +817,13 @@ class TestBase:
 
     def test_index_groupby(self, simple_index):
         idx = simple_index[:5]
-        to_groupby = np.array([1, 2, np.nan, 2, 1])
         tm.assert_dict_equal(
-            idx.groupby(to_groupby), {1.0: idx[[0, 4]], 2.0: idx[[1, 3]]}
+            idx.groupby(_GROUPBY_FLOAT_KEYS), {1.0: idx[[0, 4]], 2.0: idx[[1, 3]]}
         )
 
-        to_groupby = DatetimeIndex(
-            [
-                datetime(2011, 11, 1),
-                datetime(2011, 12, 1),
-                pd.NaT,
-                datetime(2011, 12, 1),
-                datetime(2011, 11, 1),
-            ],
-            tz="UTC",
-        ).values
-
-        ex_keys = [Timestamp("2011-11-01"), Timestamp("2011-12-01")]
+        ex_keys = _GROUPBY_DT_EXPECTED_KEYS
         expected = {ex_keys[0]: idx[[0, 4]], ex_keys[1]: idx[[1, 3]]}
-        tm.assert_dict_equal(idx.groupby(to_groupby), expected)
+        tm.assert_dict_equal(idx.groupby(_GROUPBY_DT_KEYS), expected)
 
     def test_append_preserves_dtype(self, simple_index):
         # In particular Index with dtype float32
@@ -927,10 +931,11 @@ class TestNumericBase:
         index = simple_index
         na_val = nulls_fixture
 
+        first, tail = index[0], list(index[1:])
         if na_val is pd.NaT:
-            expected = Index([index[0], pd.NaT] + list(index[1:]), dtype=object)
+            expected = Index([first, pd.NaT, *tail], dtype=object)
         else:
-            expected = Index([index[0], np.nan] + list(index[1:]))
+            expected = Index([first, np.nan, *tail])
             # GH#43921 we preserve float dtype
             if index.dtype.kind == "f":
                 expected = Index(expected, dtype=index.dtype)
@@ -948,23 +953,18 @@ class TestNumericBase:
             idx = index_cls(np.arange(5, dtype="int64"))
 
         # float conversions
-        arr = np.arange(5, dtype="int64") * 3.2
-        expected = Index(arr, dtype=np.float64)
+        expected = _ARITH_EXPECTED
         fidx = idx * 3.2
         tm.assert_index_equal(fidx, expected)
         fidx = 3.2 * idx
         tm.assert_index_equal(fidx, expected)
 
         # interops with numpy arrays
-        expected = Index(arr, dtype=np.float64)
-        a = np.zeros(5, dtype="float64")
-        result = fidx - a
+        result = fidx - _ARITH_ZEROS
         tm.assert_index_equal(result, expected)
 
-        expected = Index(-arr, dtype=np.float64)
-        a = np.zeros(5, dtype="float64")
-        result = a - fidx
-        tm.assert_index_equal(result, expected)
+        result = _ARITH_ZEROS - fidx
+        tm.assert_index_equal(result, _ARITH_EXPECTED_NEG)
 
     @pytest.mark.parametrize("complex_dtype", [np.complex64, np.complex128])
     def test_astype_to_complex(self, complex_dtype, simple_index):
@@ -86,9 +86,10 @@ class TestFactorize:
 
         # construct an integer ndarray so that
         # `expected_uniques.take(expected_codes)` is equal to `obj`
-        expected_uniques_list = list(expected_uniques)
-        expected_codes = [expected_uniques_list.index(val) for val in obj]
-        expected_codes = np.asarray(expected_codes, dtype=np.intp)
+        target = obj
+        if target.dtype == np.float16:
+            target = target.astype(np.float32)
+        expected_codes = expected_uniques.get_indexer(target)
 
         tm.assert_numpy_array_equal(result_codes, expected_codes)
         tm.assert_index_equal(result_uniques, expected_uniques, exact=True)